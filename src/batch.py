@@ -0,0 +1,142 @@
+"""
+Batch scoring for the Bulls and Cows game.
+This module scores many guesses at once with NumPy (and Numba when it is
+installed), for solvers and other callers that work over the whole
+candidate pool. The game interfaces do not import it.
+"""
+
+import functools
+from typing import Tuple
+
+import numpy as np
+
+from src.game_logic import get_pool_str, secret_digit_mask
+
+
+@functools.lru_cache(maxsize=1)
+def get_pool_u8() -> np.ndarray:
+    """
+    Get every 4-digit number with unique digits as a (5040, 4) digit array.
+    
+    Row ``i`` holds the same number as ``get_pool_str()[i]``, so the array
+    can be fed straight to the batch scorers and the surviving rows mapped
+    back to strings by index. Built on first use and shared for the life of
+    the process; treat it as read-only.
+    
+    Returns:
+        np.ndarray: uint8 array of digits in lexicographic order
+    """
+    pool = np.frombuffer(''.join(get_pool_str()).encode("ascii"), dtype=np.uint8)
+    pool = (pool - 48).reshape(-1, 4)
+    pool.setflags(write=False)
+    return pool
+
+
+def _check_inputs(guesses: np.ndarray, secret: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate batch scorer inputs and convert them to contiguous uint8 digits.
+    
+    Raises:
+        ValueError: If the secret is not all ASCII digits, the guesses are not
+            a 2-D array as wide as the secret, or a guess value is above 9
+    """
+    secret_digit_mask(secret)
+    guesses = np.ascontiguousarray(guesses, dtype=np.uint8)
+    if guesses.ndim != 2 or guesses.shape[1] != len(secret):
+        raise ValueError(
+            f"Guesses must be an (N, {len(secret)}) array to match the secret, "
+            f"got shape {guesses.shape}"
+        )
+    if guesses.size and guesses.max() > 9:
+        raise ValueError("Guess digits must be in the range 0-9")
+
+    secret_u8 = np.frombuffer(secret.encode("ascii"), dtype=np.uint8) - 48
+    return guesses, secret_u8
+
+
+def evaluate_guess_batch(guesses: np.ndarray, secret: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate many guesses against the secret number at once.
+    
+    Args:
+        guesses (np.ndarray): (N, 4) array of guess digits (0-9)
+        secret (str): The secret number
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: uint8 arrays of bulls and cows per guess
+    
+    Raises:
+        ValueError: If the secret is not all ASCII digits, does not match the
+            guess width, or a guess value is above 9
+    
+    Examples:
+        >>> bulls, cows = evaluate_guess_batch(np.array([[1, 2, 3, 4], [5, 6, 7, 8]]), "1243")
+        >>> bulls.tolist(), cows.tolist()
+        ([2, 0], [2, 0])
+    """
+    guesses, secret_arr = _check_inputs(guesses, secret)
+    secret_hot = np.zeros(10, dtype=bool)
+    secret_hot[secret_arr] = True
+
+    bulls = (guesses == secret_arr).sum(axis=1, dtype=np.uint8)
+    common = secret_hot[guesses].sum(axis=1, dtype=np.uint8)
+    return bulls, common - bulls
+
+
+@functools.lru_cache(maxsize=1)
+def _get_score_kernel():
+    """Compile the Numba scoring kernel on first use, or None without numba."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to the NumPy path
+        return None
+
+    @njit(cache=True, boundscheck=False)
+    def _score_kernel(guesses_u8, secret_u8):
+        n = guesses_u8.shape[0]
+        bulls = np.zeros(n, dtype=np.uint8)
+        cows = np.zeros(n, dtype=np.uint8)
+
+        secret_mask = 0
+        for i in range(secret_u8.shape[0]):
+            secret_mask |= 1 << secret_u8[i]
+
+        for row in range(n):
+            b = 0
+            common = 0
+            for i in range(guesses_u8.shape[1]):
+                g = guesses_u8[row, i]
+                b += g == secret_u8[i]
+                common += (secret_mask >> g) & 1
+            bulls[row] = b
+            cows[row] = common - b
+        return bulls, cows
+
+    return _score_kernel
+
+
+def evaluate_guess_batch_jit(guesses: np.ndarray, secret: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate many guesses against the secret number with a Numba kernel.
+    
+    numba is imported and the kernel compiled on the first call; falls back
+    to ``evaluate_guess_batch`` when numba is not installed.
+    
+    Args:
+        guesses (np.ndarray): (N, 4) array of guess digits (0-9)
+        secret (str): The secret number
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: uint8 arrays of bulls and cows per guess
+    
+    Raises:
+        ValueError: If the secret is not all ASCII digits, does not match the
+            guess width, or a guess value is above 9
+    """
+    score_kernel = _get_score_kernel()
+    if score_kernel is None:
+        return evaluate_guess_batch(guesses, secret)
+
+    # The kernel runs without bounds checks, so bad input must stop here
+    guesses, secret_u8 = _check_inputs(guesses, secret)
+    return score_kernel(guesses, secret_u8)
@@ -1,21 +1,21 @@
-#!/usr/bin/env python3
 """
 Command Line Interface for the Bulls and Cows game.
 This module provides a terminal-based interface for playing the game.
 """
 
-import os
-import sys
 import time
 
-# Import game logic - fixed import approach
-# We use actual relative import for better modularity
-from game_logic import (
+from src.game_logic import (
     generate_secret_number,
+    secret_digit_mask,
     evaluate_guess,
     is_valid_guess
 )
 
+# Accepted answers to the play-again prompt
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
+
 
 class BullsAndCowsCLI:
     """Command Line Interface for Bulls and Cows game."""
@@ -23,6 +23,7 @@ class BullsAndCowsCLI:
     def __init__(self):
         """Initialize the game with a new secret number and empty history."""
         self.secret = generate_secret_number()
+        self.secret_mask = secret_digit_mask(self.secret)
         self.attempts = 0
         self.history = []
         self.start_time = time.time()
@@ -46,8 +47,7 @@ class BullsAndCowsCLI:
             
         print("\n📜 GUESS HISTORY:")
         print("-" * 30)
-        for i, (guess, result) in enumerate(self.history, 1):
-            print(f"{i:2d}. {guess} ➜ {result['bulls']} Bulls, {result['cows']} Cows")
+        print("\n".join(line for _, _, line in self.history))
         print("-" * 30)
         
     def get_valid_guess(self) -> str:
@@ -91,9 +91,10 @@ class BullsAndCowsCLI:
                 print("🎉" * 10)
                 break
                 
-            result = evaluate_guess(guess, self.secret)
-            self.history.append((guess, result))
-            print(f"\n🔍 Result: {result['bulls']} Bulls, {result['cows']} Cows")
+            result = evaluate_guess(guess, self.secret, self.secret_mask)
+            line = f"{len(self.history) + 1:2d}. {guess} ➜ {result.bulls} Bulls, {result.cows} Cows"
+            self.history.append((guess, result, line))
+            print(f"\n🔍 Result: {result.bulls} Bulls, {result.cows} Cows")
             
     def play_again(self) -> bool:
         """
@@ -104,9 +105,9 @@ class BullsAndCowsCLI:
         """
         while True:
             response = input("\nDo you want to play again? (y/n): ").strip().lower()
-            if response in ['y', 'yes']:
+            if response in _YES:
                 return True
-            elif response in ['n', 'no']:
+            elif response in _NO:
                 return False
             else:
                 print("Please enter 'y' or 'n'.")
@@ -4,9 +4,39 @@ This module contains functions for generating random numbers,
 evaluating guesses, and other game mechanics.
 """
 
+import functools
+import itertools
+import operator
 import random
 import os
-from typing import Dict, Tuple
+import threading
+from typing import NamedTuple, Optional, Set, Tuple
+
+
+# Directories save_secret_number has already created this process
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+class Score(NamedTuple):
+    """Result of evaluating a guess."""
+    bulls: int
+    cows: int
+
+
+@functools.lru_cache(maxsize=1)
+def get_pool_str() -> Tuple[str, ...]:
+    """
+    Get every 4-digit number with unique digits (5040 of them).
+    
+    The pool is built on first use and shared for the life of the process.
+    Its order is the canonical candidate order: ``batch.get_pool_u8()`` is
+    built from it, so an index means the same number in both.
+    
+    Returns:
+        Tuple[str, ...]: All valid secret numbers in lexicographic order
+    """
+    return tuple(''.join(p) for p in itertools.permutations('0123456789', 4))
 
 
 def generate_secret_number() -> str:
@@ -16,9 +46,8 @@ def generate_secret_number() -> str:
     Returns:
         str: A 4-digit number as a string
     """
-    digits = random.sample(range(10), 4)
-    secret = ''.join(map(str, digits))
-    return secret
+    pool = get_pool_str()
+    return pool[random.randrange(len(pool))]
 
 
 def save_secret_number(secret: str, filepath: str = "data/secret_number.txt") -> None:
@@ -29,10 +58,27 @@ def save_secret_number(secret: str, filepath: str = "data/secret_number.txt") ->
         secret (str): The secret number to save
         filepath (str): Path to the file where the number will be saved
     """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    directory = os.path.dirname(filepath)
+    # Key on the absolute path so a later chdir can't match a stale entry
+    key = os.path.abspath(directory)
+    with _ensured_dirs_lock:
+        if key not in _ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            _ensured_dirs.add(key)
+    
+    data = secret.encode("ascii")
+    try:
+        file = open(filepath, "wb", buffering=0)
+    except FileNotFoundError:
+        # The directory was removed after we created it; recreate and retry once
+        with _ensured_dirs_lock:
+            _ensured_dirs.discard(key)
+            os.makedirs(directory, exist_ok=True)
+            _ensured_dirs.add(key)
+        file = open(filepath, "wb", buffering=0)
     
-    with open(filepath, "w") as file:
-        file.write(secret)
+    with file:
+        file.write(data)
 
 
 def load_secret_number(filepath: str = "data/secret_number.txt") -> str:
@@ -52,36 +98,123 @@ def load_secret_number(filepath: str = "data/secret_number.txt") -> str:
         return file.read().strip()
 
 
-def evaluate_guess(guess: str, secret: str) -> Dict[str, int]:
+def secret_digit_mask(secret: str) -> int:
+    """
+    Build a bitmask of the digits present in a number (one bit per digit 0-9).
+    
+    Args:
+        secret (str): The number to build the mask for
+    
+    Returns:
+        int: Bitmask with bit ``d`` set if digit ``d`` occurs in the number
+    
+    Raises:
+        ValueError: If the number contains anything other than ASCII digits
+    
+    Examples:
+        >>> secret_digit_mask("1243")
+        30
+    """
+    if not (secret.isascii() and secret.isdigit()):
+        raise ValueError(f"Number must contain only digits 0-9: {secret!r}")
+
+    mask = 0
+    for digit in secret:
+        mask |= 1 << (ord(digit) - 48)
+    return mask
+
+
+def evaluate_guess(guess: str, secret: str, secret_mask: Optional[int] = None) -> Score:
     """
     Evaluate a guess against the secret number.
     
+    Both numbers must consist of ASCII digits only, as ``is_valid_guess``
+    and ``generate_secret_number`` guarantee, so that digit membership can
+    be a bit test on the secret's mask. The secret's digits are unique, so a
+    guess digit found in the secret is either a bull or exactly one cow.
+    
     Args:
         guess (str): The guessed number
         secret (str): The secret number
+        secret_mask (Optional[int]): Precomputed ``secret_digit_mask(secret)``;
+            built on the fly when omitted
     
     Returns:
-        Dict[str, int]: Dictionary with 'bulls' and 'cows' counts
+        Score: The 'bulls' and 'cows' counts
+    
+    Raises:
+        ValueError: If the guess or secret contains anything other than
+            ASCII digits
     
     Examples:
         >>> evaluate_guess("1234", "1243")
-        {'bulls': 2, 'cows': 2}
+        Score(bulls=2, cows=2)
         >>> evaluate_guess("5678", "1234")
-        {'bulls': 0, 'cows': 0}
+        Score(bulls=0, cows=0)
+        >>> evaluate_guess("1243", "1243")
+        Score(bulls=4, cows=0)
+    """
+    if not (guess.isascii() and guess.isdigit()):
+        raise ValueError(f"Guess must contain only digits 0-9: {guess!r}")
+
+    if guess == secret:
+        return Score(len(secret), 0)
+
+    if secret_mask is None:
+        secret_mask = secret_digit_mask(secret)
+
+    bulls = sum(map(operator.eq, guess, secret))
+    cows = sum((secret_mask >> (ord(digit) - 48)) & 1 for digit in guess) - bulls
+    return Score(bulls, cows)
+
+
+def encode_number(number: str) -> int:
+    """
+    Pack a 4-digit number into an int with one digit value per byte.
+    
+    Args:
+        number (str): The 4-digit number to pack
+    
+    Returns:
+        int: Packed digits, first digit in the lowest byte
+    
+    Examples:
+        >>> hex(encode_number("1243"))
+        '0x3040201'
     """
-    result = {
-        'bulls': 0,
-        'cows': 0
-    }
+    return int.from_bytes(number.encode("ascii"), "little") - 0x30303030
 
-    for idx, digit in enumerate(guess):
-        if digit in secret:
-            if secret[idx] == digit:
-                result['bulls'] += 1
-            else:
-                result['cows'] += 1
-                
-    return result
+
+def evaluate_guess_fast(guess_code: int, secret_code: int,
+                        secret_mask: int, guess_mask: int) -> Score:
+    """
+    Evaluate a pre-encoded guess against a pre-encoded secret.
+    
+    Both numbers must have 4 unique digits. Bulls are found by comparing
+    all four packed bytes at once; cows come from the overlap of the
+    two digit masks.
+    
+    Args:
+        guess_code (int): ``encode_number(guess)``
+        secret_code (int): ``encode_number(secret)``
+        secret_mask (int): ``secret_digit_mask(secret)``
+        guess_mask (int): ``secret_digit_mask(guess)``
+    
+    Returns:
+        Score: The 'bulls' and 'cows' counts
+    
+    Examples:
+        >>> evaluate_guess_fast(encode_number("1234"), encode_number("1243"),
+        ...                     secret_digit_mask("1243"), secret_digit_mask("1234"))
+        Score(bulls=2, cows=2)
+    """
+    diff = guess_code ^ secret_code
+    # High bit of each byte is set where the digits differ; digits are < 0x80
+    # so setting the high bit first keeps the subtraction from borrowing
+    nonzero = ((diff | 0x80808080) - 0x01010101) & 0x80808080
+    bulls = bin(nonzero ^ 0x80808080).count('1')
+    cows = bin(secret_mask & guess_mask).count('1') - bulls
+    return Score(bulls, cows)
 
 
 def is_valid_guess(guess: str) -> Tuple[bool, str]:
@@ -94,12 +227,13 @@ def is_valid_guess(guess: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (is_valid, error_message)
     """
-    if not guess.isdigit():
-        return False, "Input must contain only digits"
-    
+    # Cheapest rejection first: length, then digits, then uniqueness
     if len(guess) != 4:
         return False, "Input must be exactly 4 digits long"
     
+    if not (guess.isascii() and guess.isdigit()):
+        return False, "Input must contain only digits"
+    
     if len(set(guess)) != 4:
         return False, "All digits must be unique"
         
@@ -3,26 +3,38 @@ Streamlit web application for the Bulls and Cows game.
 This module provides a web-based interface built with Streamlit.
 """
 
-import os
-import sys
 import time
 import streamlit as st
 
-# Import game logic - fixed import approach
-# We use actual relative import for better modularity
-from game_logic import (
+from src.game_logic import (
     generate_secret_number,
+    secret_digit_mask,
     evaluate_guess,
     is_valid_guess
 )
 
+GAME_RULES = """
+        **Bulls and Cows** is a code-breaking game where:
+        
+        1. The computer generates a secret 4-digit number with unique digits
+        2. You try to guess this number in as few attempts as possible
+        3. After each guess, you get feedback in the form of:
+           - **Bulls**: Correct digits in the correct position
+           - **Cows**: Correct digits in the wrong position
+        
+        For example, if the secret number is "7846" and you guess "7814", you get:
+        - 2 Bulls (7 and 4 are in the correct position)
+        - 1 Cow (8 is correct but in the wrong position)
+        
+        Try to solve the puzzle in as few guesses as possible!
+        """
+
 
 def initialize_session_state():
     """Initialize or reset the game session state."""
     if "secret" not in st.session_state:
         st.session_state.secret = generate_secret_number()
         st.session_state.attempts = 0
-        st.session_state.history = []
         st.session_state.game_won = False
         st.session_state.last_guess = ""
         st.session_state.start_time = time.time()
@@ -30,6 +42,15 @@ def initialize_session_state():
         st.session_state.victories = 0
         st.session_state.best_score = float('inf')
         st.session_state.reset_input = False  # Flag to track when to reset input
+    
+    # Derived keys are set on their own so sessions started by an older
+    # version of the app (or kept across a hot reload) pick them up too
+    if "secret_mask" not in st.session_state:
+        st.session_state.secret_mask = secret_digit_mask(st.session_state.secret)
+    if "history_cols" not in st.session_state:
+        st.session_state.history_cols = {"Attempt": [], "Guess": [], "Bulls": [], "Cows": []}
+    if "win_time" not in st.session_state:
+        st.session_state.win_time = time.time() - st.session_state.start_time
 
 
 def reset_game():
@@ -42,8 +63,9 @@ def reset_game():
             st.session_state.best_score = st.session_state.attempts
     
     st.session_state.secret = generate_secret_number()
+    st.session_state.secret_mask = secret_digit_mask(st.session_state.secret)
     st.session_state.attempts = 0
-    st.session_state.history = []
+    st.session_state.history_cols = {"Attempt": [], "Guess": [], "Bulls": [], "Cows": []}
     st.session_state.game_won = False
     st.session_state.last_guess = ""
     st.session_state.start_time = time.time()
@@ -72,21 +94,7 @@ def display_stats():
 def display_game_rules():
     """Display game rules in the sidebar."""
     with st.sidebar.expander("🎮 Game Rules", expanded=False):
-        st.markdown("""
-        **Bulls and Cows** is a code-breaking game where:
-        
-        1. The computer generates a secret 4-digit number with unique digits
-        2. You try to guess this number in as few attempts as possible
-        3. After each guess, you get feedback in the form of:
-           - **Bulls**: Correct digits in the correct position
-           - **Cows**: Correct digits in the wrong position
-        
-        For example, if the secret number is "7846" and you guess "7814", you get:
-        - 2 Bulls (7 and 4 are in the correct position)
-        - 1 Cow (8 is correct but in the wrong position)
-        
-        Try to solve the puzzle in as few guesses as possible!
-        """)
+        st.markdown(GAME_RULES)
 
 
 def main():
@@ -115,9 +123,8 @@ def main():
     with col1:
         # Display win message if game is won
         if st.session_state.game_won:
-            elapsed_time = time.time() - st.session_state.start_time
             st.success(f"🎉 Congratulations! You guessed the secret number: {st.session_state.secret}")
-            st.info(f"It took you {st.session_state.attempts} attempts and {elapsed_time:.1f} seconds!")
+            st.info(f"It took you {st.session_state.attempts} attempts and {st.session_state.win_time:.1f} seconds!")
             
             if st.button("Play Again", key="play_again_button"):
                 reset_game()
@@ -152,37 +159,29 @@ def main():
                     # Check if the guess is correct
                     if guess == st.session_state.secret:
                         st.session_state.game_won = True
+                        st.session_state.win_time = time.time() - st.session_state.start_time
                         st.rerun()
                     else:
                         # Evaluate the guess
-                        result = evaluate_guess(guess, st.session_state.secret)
-                        st.session_state.history.append((guess, result))
+                        result = evaluate_guess(guess, st.session_state.secret, st.session_state.secret_mask)
+                        history_cols = st.session_state.history_cols
+                        history_cols["Attempt"].append(len(history_cols["Attempt"]) + 1)
+                        history_cols["Guess"].append(guess)
+                        history_cols["Bulls"].append(result.bulls)
+                        history_cols["Cows"].append(result.cows)
                         
                         # Display immediate feedback
-                        st.info(f"🔍 {result['bulls']} Bulls, {result['cows']} Cows")
+                        st.info(f"🔍 {result.bulls} Bulls, {result.cows} Cows")
     
     with col2:
         # Display guess history
         st.subheader("📜 Guess History")
         
-        if not st.session_state.history:
+        if not st.session_state.history_cols["Attempt"]:
             st.write("No guesses yet. Make your first guess!")
         else:
-            # Create a nice table for the history
-            history_df = {
-                "Attempt": [],
-                "Guess": [],
-                "Bulls": [],
-                "Cows": []
-            }
-            
-            for i, (g, res) in enumerate(st.session_state.history, 1):
-                history_df["Attempt"].append(i)
-                history_df["Guess"].append(g)
-                history_df["Bulls"].append(res["bulls"])
-                history_df["Cows"].append(res["cows"])
-            
-            st.dataframe(history_df, use_container_width=True)
+            # Columns are appended as guesses come in, so no per-rerun rebuild
+            st.dataframe(st.session_state.history_cols, use_container_width=True)
         
         # Give up option
         if not st.session_state.game_won and st.session_state.attempts > 0:
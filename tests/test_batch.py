@@ -0,0 +1,28 @@
+"""
+Tests for the batch scorers.
+"""
+
+import numpy as np
+import pytest
+
+from src import batch
+from src.batch import evaluate_guess_batch, evaluate_guess_batch_jit, get_pool_u8
+
+
+@pytest.mark.parametrize("guesses, secret", [
+    (get_pool_u8(), "123"),
+    (get_pool_u8(), "12345"),
+    (get_pool_u8(), "12a4"),
+    (np.array([[1, 2, 3, 10]]), "1234"),
+])
+@pytest.mark.parametrize("score_batch", [evaluate_guess_batch, evaluate_guess_batch_jit])
+def test_batch_scorers_reject_bad_input(score_batch, guesses, secret):
+    with pytest.raises(ValueError):
+        score_batch(guesses, secret)
+
+
+def test_jit_falls_back_without_numba(monkeypatch):
+    monkeypatch.setattr(batch, "_get_score_kernel", lambda: None)
+    bulls, cows = evaluate_guess_batch_jit(np.array([[1, 2, 3, 4], [5, 6, 7, 8]]), "1243")
+    assert bulls.tolist() == [2, 0]
+    assert cows.tolist() == [2, 0]
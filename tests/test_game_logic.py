@@ -0,0 +1,108 @@
+"""
+Tests for the core game logic and the batch scorers.
+"""
+
+import shutil
+
+import pytest
+
+from src.batch import evaluate_guess_batch, evaluate_guess_batch_jit, get_pool_u8
+from src.game_logic import (
+    encode_number,
+    evaluate_guess,
+    evaluate_guess_fast,
+    get_pool_str,
+    is_valid_guess,
+    save_secret_number,
+    secret_digit_mask,
+)
+
+POOL = get_pool_str()
+# A spread of secrets across the pool, scored against every candidate guess
+SECRETS = POOL[::97] + ("9876",)
+
+
+def reference_score(guess, secret):
+    """Score a guess the straightforward way, digit by digit."""
+    bulls = cows = 0
+    for idx, digit in enumerate(guess):
+        if digit in secret:
+            if secret[idx] == digit:
+                bulls += 1
+            else:
+                cows += 1
+    return bulls, cows
+
+
+def test_pool_orders_match():
+    pool_u8 = get_pool_u8()
+    assert len(POOL) == 5040
+    assert pool_u8.shape == (5040, 4)
+    assert tuple(''.join(map(str, row)) for row in pool_u8) == POOL
+
+
+@pytest.mark.parametrize("secret", SECRETS)
+def test_scorers_match_reference(secret):
+    secret_mask = secret_digit_mask(secret)
+    secret_code = encode_number(secret)
+    expected = [reference_score(guess, secret) for guess in POOL]
+
+    assert [tuple(evaluate_guess(guess, secret, secret_mask)) for guess in POOL] == expected
+    assert [
+        tuple(evaluate_guess_fast(encode_number(guess), secret_code,
+                                  secret_mask, secret_digit_mask(guess)))
+        for guess in POOL
+    ] == expected
+
+    for score_batch in (evaluate_guess_batch, evaluate_guess_batch_jit):
+        bulls, cows = score_batch(get_pool_u8(), secret)
+        assert list(zip(bulls.tolist(), cows.tolist())) == expected
+
+
+@pytest.mark.parametrize("guess, secret", [("12 4", "1234"), ("12a4", "1234"), ("1234", "12 4")])
+def test_evaluate_guess_rejects_non_digits(guess, secret):
+    with pytest.raises(ValueError):
+        evaluate_guess(guess, secret)
+
+
+def test_save_secret_number_writes_exact_bytes(tmp_path):
+    filepath = tmp_path / "data" / "secret_number.txt"
+    save_secret_number("0937", str(filepath))
+    assert filepath.read_bytes() == b"0937"
+
+
+def test_save_secret_number_after_chdir(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    save_secret_number("1234")
+    monkeypatch.chdir(second)
+    save_secret_number("5678")
+
+    assert (first / "data" / "secret_number.txt").read_bytes() == b"1234"
+    assert (second / "data" / "secret_number.txt").read_bytes() == b"5678"
+
+
+def test_save_secret_number_recreates_deleted_directory(tmp_path):
+    directory = tmp_path / "data"
+    filepath = directory / "secret_number.txt"
+    save_secret_number("1234", str(filepath))
+
+    shutil.rmtree(directory)
+    save_secret_number("5678", str(filepath))
+
+    assert filepath.read_bytes() == b"5678"
+
+
+@pytest.mark.parametrize("guess, expected", [
+    ("1234", (True, "")),
+    ("١٢٣٤", (False, "Input must contain only digits")),
+    ("１２３４", (False, "Input must contain only digits")),
+    ("12a", (False, "Input must be exactly 4 digits long")),
+    ("12ab5", (False, "Input must be exactly 4 digits long")),
+    ("1123", (False, "All digits must be unique")),
+])
+def test_is_valid_guess(guess, expected):
+    assert is_valid_guess(guess) == expected